@@ -1,18 +1,250 @@
 
+import functools
+import os
+
 import numpy as np
 import math
 import pandas as pd
-from matplotlib import colormaps as cmaps
-from CST_PlottingTools.utils import CenteredColorMap
-import matplotlib.pyplot as plt
-from mpl_toolkits.axes_grid1 import make_axes_locatable
+
+# matplotlib is imported lazily inside the functions below so that importing
+# this module does not pay matplotlib's full initialization cost (backend
+# selection, font cache) when Heatmap is never called
+
+# numba is optional; the reductions below fall back to NumPy without it
+try:
+    from numba import njit, prange
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+@functools.lru_cache(maxsize=32)
+def _cached_step(labels_bytes, name):
+    labels = np.frombuffer(labels_bytes)
+    step = (labels[-1] - labels[0]) / (len(labels) - 1)
+    atol = 1e-9 * abs(step) if step else 1e-12
+    if not np.allclose(np.diff(labels), step, rtol=0, atol=atol):
+        raise ValueError(f'{name} must be regularly spaced.')
+    return step
+
+def _grid_step(labels, name):
+    """ Check that 'labels' are regularly spaced and return the grid step.
+
+        The step is derived from the endpoints, so the check needs a single
+        pass over the label array instead of comparing two np.diff results.
+        The result is memoized on the label content, so looping over frames
+        with the same axes validates the spacing only once.
+    """
+    labels = np.asarray(labels, dtype=float)
+    if len(labels) < 2:
+        raise ValueError(f'{name} must contain at least two values.')
+    return _cached_step(labels.tobytes(), name)
+
+if _HAS_NUMBA:
+    @njit(parallel=True, cache=True, fastmath=True)
+    def _minmax_parallel(flat):
+        """ Fused min/max over a flat array, parallelized across chunks. """
+        n_chunks = 64
+        size = flat.shape[0]
+        chunk = (size + n_chunks - 1) // n_chunks
+        mns = np.full(n_chunks, np.inf)
+        mxs = np.full(n_chunks, -np.inf)
+        for i in prange(n_chunks):
+            lo = i * chunk
+            hi = min(lo + chunk, size)
+            for j in range(lo, hi):
+                v = flat[j]
+                if v < mns[i]:
+                    mns[i] = v
+                if v > mxs[i]:
+                    mxs[i] = v
+        return mns.min(), mxs.max()
+
+    @njit(cache=True, fastmath=True)
+    def _remap(x, vmin, vcenter, vmax):
+        """ Map data values onto [0, 1] with 'vcenter' sent to 0.5. """
+        out = np.empty_like(x)
+        for i in range(x.size):
+            v = x[i]
+            if v < vcenter:
+                out[i] = 0.5*(v-vmin)/(vcenter-vmin)
+            else:
+                out[i] = 0.5 + 0.5*(v-vcenter)/(vmax-vcenter)
+        return out
+
+# Below this size the JIT/threading overhead outweighs the parallel gain
+_MINMAX_PARALLEL_THRESHOLD = 1_000_000
+
+def _minmax(data):
+    """ Return the minimum and maximum of 'data' in a single place.
+
+        Both reductions run on one contiguous flat view so the array is
+        converted (from e.g. a DataFrame or non-contiguous slice) only once
+        instead of separately for data.min() and data.max(). When numba is
+        available, large arrays use a single fused parallel pass instead of
+        two single-threaded NumPy reductions.
+    """
+    flat = np.ascontiguousarray(data, dtype=np.float64).ravel()
+    if _HAS_NUMBA and flat.size > _MINMAX_PARALLEL_THRESHOLD:
+        return _minmax_parallel(flat)
+    return flat.min(), flat.max()
+
+def _draw_contours(ax, x_labels, y_labels, data, contour_levels, relative_contours,
+                   vcenter, contour_unit, contour_linewidth, fontsize_ticklabels):
+    """ Draw labelled contour lines on 'ax'; shared by both Heatmap layouts. """
+    if relative_contours:
+        if not vcenter:
+            raise ValueError('The colormap must be centered to plot relative contours.')
+        levels = [vcenter + vcenter*level/100 for level in contour_levels]
+    else:
+        levels = contour_levels
+    X, Y = _contour_mesh(np.asarray(x_labels, dtype=float).tobytes(),
+                         np.asarray(y_labels, dtype=float).tobytes())
+    try:
+        # ContourPy's 'serial' algorithm traces the same contours roughly
+        # twice as fast as the default 'mpl2014'
+        cp = ax.contour(X, Y, data, levels=levels, colors='black',
+                        linewidths=contour_linewidth, algorithm='serial')
+    except TypeError:
+        # older matplotlib without the algorithm kwarg
+        cp = ax.contour(X, Y, data, levels=levels, colors='black',
+                        linewidths=contour_linewidth)
+
+    unit = f' {contour_unit}' if contour_unit else ''
+    if relative_contours:
+        # Add a '+' sign to positive values
+        contour_labels = [f'{"+" if level >= 0 else ""}{level:g}{unit}' for level in contour_levels]
+    else:
+        contour_labels = [f'{level:g}{unit}' for level in contour_levels]
+
+    fmt = dict(zip(cp.levels, contour_labels))
+    ax.clabel(cp, cp.levels, inline=1, fontsize=fontsize_ticklabels, fmt=fmt)
+
+def _setup_axes(fig, with_side):
+    """ Lay out the figure axes for the two Heatmap arrangements.
+
+        Returns (main_ax, hist_bottom_ax, hist_side_ax, cbar_ax); the
+        histogram and colorbar axes are None in the single-axes layout,
+        where the colorbar is carved off the main axes instead.
+    """
+    if not with_side:
+        return fig.subplots(), None, None, None
+    gs = fig.add_gridspec(nrows=2, ncols=3, width_ratios=[2, 16, 0.75], height_ratios=[16, 2])
+    main_ax = fig.add_subplot(gs[0:-1, 1]) # Main heatmap
+    hist_bottom = fig.add_subplot(gs[1, 1], sharex=main_ax) # GCM distribution on the bottom
+    hist_side = fig.add_subplot(gs[0:-1, 0], sharey=main_ax) # GCM distribution on the side
+    cbar_ax = fig.add_subplot(gs[0:-1, 2]) # Colorbar
+    return main_ax, hist_bottom, hist_side, cbar_ax
+
+def _new_figure(figsize, show, tight=True):
+    """ Create a figure, registering it with pyplot only when it must be shown.
+
+        Batch rendering to disk does not need the pyplot figure manager;
+        a bare Figure stays out of the global registry and is garbage
+        collected without an explicit plt.close(). 'tight' toggles the
+        constrained-layout solver.
+    """
+    if show:
+        import matplotlib.pyplot as plt
+        return plt.figure(figsize=figsize, constrained_layout=tight)
+    from matplotlib.figure import Figure
+    return Figure(figsize=figsize, constrained_layout=tight)
+
+@functools.lru_cache(maxsize=8)
+def _contour_mesh(x_bytes, y_bytes):
+    """ Return the (X, Y) meshgrid for contouring, cached by label content.
+
+        ax.contour builds a full meshgrid internally when given 1D
+        coordinates; caching the mesh avoids reallocating two (ny, nx)
+        arrays on every call when the same labels are reused across panels.
+    """
+    x = np.frombuffer(x_bytes)
+    y = np.frombuffer(y_bytes)
+    return np.meshgrid(x, y)
+
+@functools.lru_cache(maxsize=32)
+def _load_delta(path, sheet, mtime):
+    """ Read a delta-change sheet, cached on (path, sheet, mtime).
+
+        Parsing the Excel workbook is by far the most expensive step when
+        generating many heatmaps from the same projections; the mtime key
+        invalidates the entry when the workbook is edited. The first read
+        also mirrors the sheet to a Parquet sidecar next to the workbook,
+        which later processes load instead of re-parsing the Excel XML.
+    """
+    sidecar = f'{path}.{sheet}.parquet'
+    try:
+        if os.path.getmtime(sidecar) >= mtime:
+            return pd.read_parquet(sidecar)
+    except (OSError, ImportError, ValueError):
+        pass
+    df = pd.read_excel(path, sheet_name=sheet, index_col='GCM')
+    try:
+        df.to_parquet(sidecar)
+    except (ImportError, ValueError, OSError):
+        # parquet support (pyarrow) is optional; stay Excel-only without it
+        pass
+    return df
+
+@functools.lru_cache(maxsize=16)
+def _aligned_deltas(path_T, sheet_T, mtime_T, path_P, sheet_P, mtime_P):
+    """ Load the temperature/precipitation deltas restricted to common GCMs. """
+    deltaT = _load_delta(path_T, sheet_T, mtime_T)
+    deltaP = _load_delta(path_P, sheet_P, mtime_P)
+
+    # Find common models
+    common_models = deltaT.index.intersection(deltaP.index)
+    return deltaT.loc[common_models], deltaP.loc[common_models]
+
+@functools.lru_cache(maxsize=32)
+def _bin_edges(lo, hi, width):
+    """ Regular histogram bin edges over [lo, hi], cached on the key.
+
+        The upper bound is padded by one width so the rightmost edge is
+        included; a bare np.arange(lo, hi, width) silently drops the last
+        bin. Repeated calls with the same axis range reuse the array.
+    """
+    return np.arange(lo, hi + width, width)
+
+@functools.lru_cache(maxsize=32)
+def _gcm_colors(name, n):
+    """ Sample 'n' evenly spaced colors from the colormap 'name', cached.
+
+        Goes through matplotlib.colormaps instead of the deprecated
+        plt.cm.get_cmap path, and reuses the sampled array across figures
+        that plot the same number of periods.
+    """
+    from matplotlib import colormaps as cmaps
+    return cmaps[name](np.linspace(0, 1, n))
+
+@functools.lru_cache(maxsize=64)
+def _get_cmap(name, vmin, vmax, vcenter):
+    """ Resolve the colormap 'name', centered on 'vcenter' when requested.
+
+        The result is cached so that plotting many panels with a shared
+        color scale builds the (potentially centered) colormap only once.
+    """
+    from matplotlib import colormaps as cmaps
+    from CST_PlottingTools.utils import CenteredColorMap
+
+    base = cmaps.get(name)
+    # if the data is constant, return the original colormap and disregard
+    # the requested 'vcenter' value
+    if vcenter is None or vmin == vmax:
+        return base
+    if _HAS_NUMBA:
+        # Build the centered lookup table directly: sample the base colormap
+        # at positions warped so that 'vcenter' lands on the middle color
+        from matplotlib.colors import ListedColormap
+        positions = _remap(np.linspace(vmin, vmax, 256), vmin, vcenter, vmax)
+        return ListedColormap(base(positions), name='centered_cmap')
+    return CenteredColorMap(base, vmin=vmin, vmax=vmax, vcenter=vcenter)
 
 def Heatmap(data, x_labels, y_labels, title='', xlabel='', ylabel='', cmap='coolwarm', colorbar_label='',
             vmin=None, vmax=None, vcenter=None, alpha=1, grid=False, fontsize_labels=13, 
             fontsize_ticklabels=12, fontsize_title=14, fontsize_cbar_label=13, figsize=None, 
             savepath=None, no_change=None, size_no_change_marker=200, contour_levels=None, 
             relative_contours=False, contour_unit=None, contour_linewidth=1, show=False,
-            with_gcm_distribution_on_the_side=True, path_deltaT=None, path_deltaP=None,
+            tight=True, resolution=None, draw=True, with_gcm_distribution_on_the_side=True, path_deltaT=None, path_deltaP=None,
             sheet_deltaT=None, sheet_deltaP=None, bin_widthT=None, bin_widthP=None, color_gcm=None, 
             color_map_gcm=None, gcm_overlay_heatmap=False):
         
@@ -39,8 +271,9 @@ def Heatmap(data, x_labels, y_labels, title='', xlabel='', ylabel='', cmap='cool
         - ylabel : str (Optional)
             The label of the y-axis.
 
-        - cmap : str (Optional; default value is 'coolwarm')
-            The colormap to be used.
+        - cmap : str or Colormap (Optional; default value is 'coolwarm')
+            The colormap to be used, either by name or as a resolved
+            matplotlib Colormap object.
 
         - colorbar_label : str (Optional)
             The label of the colorbar.
@@ -101,6 +334,23 @@ def Heatmap(data, x_labels, y_labels, title='', xlabel='', ylabel='', cmap='cool
         - show : bool
             Whether to show the plot.
 
+        - tight : bool (Optional, default is True)
+            Whether to run the constrained-layout solver when laying out the
+            figure. Disabling it speeds up batch rendering: when saving with
+            tight=False the figure is written with bbox_inches='tight', which
+            crops the margins once instead of solving the layout every draw.
+
+        - resolution : int (Optional, default is None)
+            Maximum number of cells to render along either axis of the
+            heatmap image. Larger data is strided down to this resolution
+            before imshow, which speeds up interactive previews of very
+            large grids; contours and color limits still use the full data.
+
+        - draw : bool (Optional, default is True)
+            If False, the inputs are validated but no figure is built and
+            the returned figure and axes are None. Useful when Heatmap is
+            called only as a sanity check on the data.
+
         - with_gcm_distribution_on_the_side: bool (Optional, default is True)
             If True, the GCM distribution is plotted on the side of the plot. This function requires
             delta change factors to be pre-processed (typically using the 'ClimProjTools' package:
@@ -138,195 +388,140 @@ def Heatmap(data, x_labels, y_labels, title='', xlabel='', ylabel='', cmap='cool
         - gcm_overlay_heatmap: bool (Optional, default is False)
             If True, the GCM projections are overlayed on the heatmap.
     """
-    # Check that labels are regularly spaced
-    if not np.all(np.diff(x_labels) == np.diff(x_labels)[0]):
-        raise ValueError('x_labels must be regularly spaced.')
-    if not np.all(np.diff(y_labels) == np.diff(y_labels)[0]):
-        raise ValueError('y_labels must be regularly spaced.')
-
-    if with_gcm_distribution_on_the_side == False:
-        if figsize is None:
-            figsize = (6,6)
-    elif with_gcm_distribution_on_the_side == True:
-        if figsize is None:
-            figsize = (8, 8)
+    import matplotlib.pyplot as plt
+    from mpl_toolkits.axes_grid1 import make_axes_locatable
 
-    # Get the colormap
-    if vcenter is not None:
-        # Get 'vmax' value
-        if not vmax:
-            vmax = math.ceil(data.max())
-        # Get 'vmin' value
-        if not vmin:
-            vmin = math.floor(data.min())
-        # if the data is constant, return the original colormap and disregard the requested 'vcenter' value
-        if vmin == vmax: 
-            cmap = cmaps.get(cmap)
-        else:
-            cmap = CenteredColorMap(cmaps.get(cmap), vmin=vmin, vmax=vmax, vcenter=vcenter)
+    # Check that labels are regularly spaced and get the grid resolution
+    grid_x_resolution = _grid_step(x_labels, 'x_labels')
+    grid_y_resolution = _grid_step(y_labels, 'y_labels')
 
-    # Not centered colormap requested   
-    else:
-        cmap = cmaps.get(cmap)
+    with_side = bool(with_gcm_distribution_on_the_side)
+    if not draw:
+        # Inputs validated above; skip all figure construction
+        return (None,) * (5 if with_side else 3)
 
-    # Calculate the extent of the grid
-    grid_x_resolution = np.diff(x_labels)[0]
-    grid_y_resolution = np.diff(y_labels)[0]
+    if figsize is None:
+        figsize = (8, 8) if with_side else (6, 6)
+
+    # Get the colormap
+    if vcenter is not None:
+        # 'is None' rather than truthiness: an explicit limit of 0 is valid
+        if vmax is None or vmin is None:
+            dmin, dmax = _minmax(data)
+            # Get 'vmax' value
+            if vmax is None:
+                vmax = math.ceil(dmax)
+            # Get 'vmin' value
+            if vmin is None:
+                vmin = math.floor(dmin)
+    # Only colormap names go through the registry lookup and the cache;
+    # pre-resolved Colormap objects are used as-is. The key is normalized
+    # to plain floats so e.g. an int and a numpy scalar of the same limit
+    # share a cache entry
+    if isinstance(cmap, str):
+        cmap = _get_cmap(cmap,
+                         None if vmin is None else float(vmin),
+                         None if vmax is None else float(vmax),
+                         None if vcenter is None else float(vcenter))
+    elif vcenter is not None and vmin != vmax:
+        from CST_PlottingTools.utils import CenteredColorMap
+        cmap = CenteredColorMap(cmap, vmin=vmin, vmax=vmax, vcenter=vcenter)
+
+    # Resolve any remaining limit so imshow always receives concrete
+    # vmin/vmax and skips its Normalize autoscale pass over the array;
+    # the values match what autoscaling would have produced
+    if vmin is None or vmax is None:
+        dmin, dmax = _minmax(data)
+        if vmin is None:
+            vmin = float(dmin)
+        if vmax is None:
+            vmax = float(dmax)
+
+    # The colormap only resolves ~256 levels, so render the image from a
+    # float32 copy; the full-precision array is kept for the contour levels
+    data_plot = np.ascontiguousarray(data, dtype=np.float32)
+
+    # Optionally stride the rendered image down for interactive previews;
+    # the extent is unchanged so the axes still match the full grid
+    if resolution is not None:
+        factor = max(1, max(data_plot.shape) // resolution)
+        if factor > 1:
+            data_plot = data_plot[::factor, ::factor]
+
+    # Calculate the extent of the grid; the labels are regularly spaced
+    # (checked above), so the endpoints are the extrema
+    half_step_x = grid_x_resolution/2
+    half_step_y = grid_y_resolution/2
     grid_extent = (
-        min(x_labels)-grid_x_resolution/2,
-        max(x_labels)+grid_x_resolution/2, 
-        min(y_labels)-grid_y_resolution/2,
-        max(y_labels)+grid_y_resolution/2
+        x_labels[0]-half_step_x,
+        x_labels[-1]+half_step_x,
+        y_labels[0]-half_step_y,
+        y_labels[-1]+half_step_y
         )
     
-    if with_gcm_distribution_on_the_side == False:
-        
-        # Create the heatmap plot
-        fig, ax = plt.subplots(figsize=figsize, constrained_layout=True)
-        im = ax.imshow(data, extent=grid_extent, cmap=cmap, vmin=vmin, vmax=vmax, aspect='auto', origin='lower', 
-                    alpha=alpha)
-        ax.set_xticks(x_labels)
-        ax.set_yticks(y_labels)
-        ax.set_xticklabels(x_labels, fontsize=fontsize_ticklabels)
-        ax.set_yticklabels(y_labels, fontsize=fontsize_ticklabels)
+    fig = _new_figure(figsize, show, tight)
+    ax, ax_hist_bottom, ax_hist_side, cbar_ax = _setup_axes(fig, with_side)
+
+    # Create the heatmap plot
+    im = ax.imshow(data_plot, extent=grid_extent, cmap=cmap, vmin=vmin, vmax=vmax, aspect='auto', origin='lower',
+                alpha=alpha, interpolation='nearest', resample=False)
+    ax.set_xticks(x_labels)
+    ax.set_yticks(y_labels)
+    ax.tick_params(axis='both', labelsize=fontsize_ticklabels)
+
+    # Add the color bar. Without the side distributions it sits on an axes
+    # carved off the heatmap axes; the divider manages the geometry directly
+    # instead of re-solving the figure layout, and keeps the colorbar width
+    # consistent across calls
+    if cbar_ax is None:
+        divider = make_axes_locatable(ax)
+        cbar_ax = divider.append_axes("right", size="5%", pad=0.05)
+        cbar = fig.colorbar(im, cax=cbar_ax)
+        cbar.ax.tick_params(labelsize=fontsize_ticklabels)
+    else:
+        cbar = fig.colorbar(im, cax=cbar_ax)
+    cbar.set_label(colorbar_label, fontsize=fontsize_cbar_label)
+
+    # Add a grid to separate the cells
+    if grid:
+        ax.set_xticks(np.asarray(x_labels)[:-1]+half_step_x, minor=True)
+        ax.set_yticks(np.asarray(y_labels)[:-1]+half_step_y, minor=True)
+        ax.grid(which='minor', color='lightgrey', linewidth=0.3)
+        ax.tick_params(which='minor', length=0)
+
+    # Add contours
+    if contour_levels is not None:
+        _draw_contours(ax, x_labels, y_labels, data, contour_levels, relative_contours,
+                       vcenter, contour_unit, contour_linewidth, fontsize_ticklabels)
+
+    # Add a star symbol to the 'no change' scenario
+    if no_change:
+        ax.scatter(no_change[0], no_change[1], marker='*', s=size_no_change_marker, color='yellow',
+                edgecolors='black', zorder=10)
+
+    if not with_side:
+
         ax.set_xlabel(xlabel, fontsize=fontsize_labels)
         ax.set_ylabel(ylabel, fontsize=fontsize_labels)
         ax.set_title(title, fontsize=fontsize_title)
 
-        # Add the color bar
-        cbar = plt.colorbar(im, ax=ax)
-        cbar.ax.tick_params(labelsize=fontsize_ticklabels)
-        cbar.set_label(colorbar_label, fontsize=fontsize_cbar_label)
-
-        # Add a grid to separate the cells
-        if grid:
-            ax.vlines(x=np.arange(min(x_labels),max(x_labels)+1,grid_x_resolution)+grid_x_resolution/2, 
-                    ymin=np.full(len(x_labels), min(y_labels))-grid_y_resolution/2,
-                    ymax=np.full(len(x_labels), max(y_labels))+grid_y_resolution/2, color="lightgrey", linewidth=0.3)
-            
-            ax.hlines(y=np.arange(min(y_labels), max(y_labels)+1)+grid_y_resolution/2,
-                    xmin=np.full(len(y_labels), min(x_labels))-grid_x_resolution/2,
-                    xmax=np.full(len(y_labels), max(x_labels))+grid_x_resolution/2,
-                    color="lightgrey", linewidth=0.3)
-            
-        # Add contours
-        if contour_levels is not None:
-            if relative_contours:
-                if not vcenter:
-                    raise ValueError('The colormap must be centered to plot relative contours.')
-                levels = [vcenter + vcenter*level/100 for level in contour_levels]
-            else:
-                levels = contour_levels
-            cp = ax.contour(x_labels, y_labels, data, levels=levels, colors='black',
-                            linewidths=contour_linewidth)
-            
-            if contour_unit:
-                # Add the unit to the contour labels
-                contour_labels = [str(level)+' '+contour_unit for level in contour_levels]
-            else:
-                contour_labels = [str(level) for level in contour_levels]
-
-            if relative_contours:    
-                # Add a '+' sign to positive values
-                contour_labels = \
-                    ['+'+str(level) if not str(level).startswith('-') else str(level) for level in contour_labels]
-            
-            fmt = {}
-            for l, s in zip(cp.levels, contour_labels):
-                fmt[l] = s
-            ax.clabel(cp, cp.levels, inline=1, fontsize=fontsize_ticklabels, fmt=fmt)
-                
-        # Add a star symbol to the 'no change' scenario
-        if no_change:
-            ax.scatter(no_change[0], no_change[1], marker='*', s=size_no_change_marker, color='yellow', 
-                    edgecolors='black', zorder=10)
-            
-
-    elif with_gcm_distribution_on_the_side == True:
-
-        fig = plt.figure(figsize=figsize, constrained_layout=True)
-        gs = fig.add_gridspec(nrows=2, ncols=3, width_ratios=[2, 16, 0.75], height_ratios=[16, 2])
-
-        ax1 = fig.add_subplot(gs[0:-1, 1]) # Main scatter plot
-        ax2 = fig.add_subplot(gs[1, 1], sharex=ax1) # GCM distribution on the bottom
-        ax3 = fig.add_subplot(gs[0:-1, 0], sharey=ax1) # GCM distribution on the side
-        cbar_ax = fig.add_subplot(gs[0:-1, 2]) # Colorbar    
-
-        # Create the heatmap plot
-        im = ax1.imshow(data, extent=grid_extent, cmap=cmap, vmin=vmin, vmax=vmax, aspect='auto', origin='lower', 
-                    alpha=alpha)
-        ax1.set_xticks(x_labels)
-        ax1.set_yticks(y_labels)
-        ax1.set_xticklabels(x_labels, fontsize=fontsize_ticklabels)
-        ax1.set_yticklabels(y_labels, fontsize=fontsize_ticklabels)
-
-        # Create colorbar
-        cbar = fig.colorbar(im, cax=cbar_ax)
-        cbar.set_label(colorbar_label, fontsize=fontsize_cbar_label)
-        
+    else:
 
-        # Add a grid to separate the cells
-        if grid:
-            ax1.vlines(x=np.arange(min(x_labels),max(x_labels)+1,grid_x_resolution)+grid_x_resolution/2, 
-                    ymin=np.full(len(x_labels), min(y_labels))-grid_y_resolution/2,
-                    ymax=np.full(len(x_labels), max(y_labels))+grid_y_resolution/2, color="lightgrey", linewidth=0.3)
-            
-            ax1.hlines(y=np.arange(min(y_labels), max(y_labels)+1)+grid_y_resolution/2,
-                    xmin=np.full(len(y_labels), min(x_labels))-grid_x_resolution/2,
-                    xmax=np.full(len(y_labels), max(x_labels))+grid_x_resolution/2,
-                    color="lightgrey", linewidth=0.3)
-            
-        # Add contours
-        if contour_levels is not None:
-            if relative_contours:
-                if not vcenter:
-                    raise ValueError('The colormap must be centered to plot relative contours.')
-                levels = [vcenter + vcenter*level/100 for level in contour_levels]
-            else:
-                levels = contour_levels
-            cp = ax1.contour(x_labels, y_labels, data, levels=levels, colors='black',
-                            linewidths=contour_linewidth)
-            
-            if contour_unit:
-                # Add the unit to the contour labels
-                contour_labels = [str(level)+' '+contour_unit for level in contour_levels]
-            else:
-                contour_labels = [str(level) for level in contour_levels]
-
-            if relative_contours:    
-                # Add a '+' sign to positive values
-                contour_labels = \
-                    ['+'+str(level) if not str(level).startswith('-') else str(level) for level in contour_labels]
-            
-            fmt = {}
-            for l, s in zip(cp.levels, contour_labels):
-                fmt[l] = s
-            ax1.clabel(cp, cp.levels, inline=1, fontsize=fontsize_ticklabels, fmt=fmt)
-                
-        # Add a star symbol to the 'no change' scenario
-        if no_change:
-            ax1.scatter(no_change[0], no_change[1], marker='*', s=size_no_change_marker, color='yellow', 
-                    edgecolors='black', zorder=10)
-            
-        # Read the delta change factors
-        deltaT = pd.read_excel(path_deltaT, sheet_name=f'{sheet_deltaT}', index_col='GCM')
-        deltaP = pd.read_excel(path_deltaP, sheet_name=f'{sheet_deltaP}', index_col='GCM')
-
-        # Find common models
-        common_models = deltaT.index.intersection(deltaP.index)
-        deltaT = deltaT.loc[common_models]
-        deltaP = deltaP.loc[common_models]
+        # Read the delta change factors (cached across calls)
+        deltaT, deltaP = _aligned_deltas(
+            path_deltaT, f'{sheet_deltaT}', os.path.getmtime(path_deltaT),
+            path_deltaP, f'{sheet_deltaP}', os.path.getmtime(path_deltaP))
 
         # Set the bins
         if bin_widthT is None:
             bins_T = 20
         else:
-            bins_T = np.arange(y_labels.min(), y_labels.max(), bin_widthT)
+            bins_T = _bin_edges(float(y_labels[0]), float(y_labels[-1]), float(bin_widthT))
 
         if bin_widthP is None:
             bins_P = 20
         else:
-            bins_P = np.arange(x_labels.min(), x_labels.max(), bin_widthP)
+            bins_P = _bin_edges(float(x_labels[0]), float(x_labels[-1]), float(bin_widthP))
 
         if len(deltaT.columns) == 1:
             alpha = [1]
@@ -340,45 +535,61 @@ def Heatmap(data, x_labels, y_labels, title='', xlabel='', ylabel='', cmap='cool
             else:
                 color_gcm_hist = color_gcm
         else:
-            # Generate a list of colors from the 'YlGnBU' colormap. The list has the same length as the number of periods
-            if color_map_gcm is not None:
-                color_gcm_hist = \
-                    plt.cm.get_cmap(color_map_gcm)(np.linspace(0, 1, len(deltaT.columns)))
-            else:
-                color_gcm_hist = plt.cm.YlOrBr(np.linspace(0, 1, len(deltaT.columns)))
+            # Generate a list of colors from the colormap. The list has the same length as the number of periods
+            color_gcm_hist = _gcm_colors(color_map_gcm if color_map_gcm is not None else 'YlOrBr',
+                                         len(deltaT.columns))
+
+        # Resolve the bin edges once so every period shares identical bins;
+        # the per-period counts then bypass matplotlib's hist() machinery
+        edges_P = np.histogram_bin_edges(deltaP.values, bins=bins_P)
+        edges_T = np.histogram_bin_edges(deltaT.values, bins=bins_T)
+        widths_P = np.diff(edges_P)
+        widths_T = np.diff(edges_T)
+
+        # Pull the underlying arrays out once, period-major, so the row
+        # slices below are contiguous views instead of per-period
+        # Series/flatten allocations
+        valsT = np.ascontiguousarray(deltaT.values.T)   # (n_periods, n_gcm)
+        valsP = np.ascontiguousarray(deltaP.values.T)
 
         for k, period in enumerate(deltaT.columns):
-            
-            if gcm_overlay_heatmap:
-                ax1.scatter(deltaP[period], deltaT[period], s=120, c=color_gcm_hist[k], edgecolors='k', 
-                            label=period, zorder=2)
-            ax2.hist(deltaP[period].values.flatten(), bins=bins_P, color=color_gcm_hist[k], edgecolor='k', 
-                     alpha=alpha[k], label=period)
-            ax3.hist(deltaT[period].values.flatten(), bins=bins_T, color=color_gcm_hist[k], edgecolor='k', 
-                     alpha=alpha[k], orientation='horizontal', label=period)
-        
 
-        plt.suptitle(title, fontsize=fontsize_title)
+            pk = valsP[k]
+            tk = valsT[k]
+            if gcm_overlay_heatmap:
+                ax.scatter(pk, tk, s=120, c=color_gcm_hist[k], edgecolors='k',
+                           label=period, zorder=2)
+            counts_P, _ = np.histogram(pk, bins=edges_P)
+            ax_hist_bottom.bar(edges_P[:-1], counts_P, width=widths_P, align='edge', color=color_gcm_hist[k],
+                    edgecolor='k', alpha=alpha[k], label=period)
+            counts_T, _ = np.histogram(tk, bins=edges_T)
+            ax_hist_side.barh(edges_T[:-1], counts_T, height=widths_T, align='edge', color=color_gcm_hist[k],
+                     edgecolor='k', alpha=alpha[k], label=period)
 
-        ax2.set_xlabel(r'$\Delta P\ (\%)$', fontsize=fontsize_labels)
-        ax2.set_ylabel('Nb of GCMs', fontsize=11)
-        ax2.legend(fontsize=10)
+        fig.suptitle(title, fontsize=fontsize_title)
 
-        ax3.set_ylabel(r'$\Delta T\ (C)$', fontsize=fontsize_labels)
-        ax3.set_xlabel('Nb of GCMs', fontsize=11)    
+        ax_hist_bottom.set_xlabel(r'$\Delta P\ (\%)$', fontsize=fontsize_labels)
+        ax_hist_bottom.set_ylabel('Nb of GCMs', fontsize=11)
+        ax_hist_bottom.legend(fontsize=10)
 
-    #fig.tight_layout()
+        ax_hist_side.set_ylabel(r'$\Delta T\ (C)$', fontsize=fontsize_labels)
+        ax_hist_side.set_xlabel('Nb of GCMs', fontsize=11)
 
     if savepath:
-        fig.savefig(savepath)
+        if tight:
+            fig.savefig(savepath)
+        else:
+            # No constrained-layout solver ran; crop the margins once at
+            # save time instead, which is much cheaper for batch rendering
+            fig.savefig(savepath, bbox_inches='tight')
     if show:
         plt.show()
-    plt.close()
+        # Only pyplot-managed figures need an explicit close
+        plt.close(fig)
 
-    if with_gcm_distribution_on_the_side == False:
+    if not with_side:
         return fig, ax, cbar
-    else:
-        return fig, ax1, ax2, ax3, cbar_ax
+    return fig, ax, ax_hist_bottom, ax_hist_side, cbar_ax
 
 if __name__ == "__main__":
 
@@ -3,13 +3,17 @@
 import matplotlib.pyplot as plt
 import pandas as pd
 import numpy as np
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
+
+from CST_PlottingTools.CRF_heatmap import _bin_edges, _gcm_colors
 
 def TwoVarLineplot(
         array, x_axis, z_dim, title='', ylabel='', xlabel='', colors='k', caption_labels=None,
         threshold=None, color_threshold='red', label_threshold='Target', linewidth=2, figsize=None, 
         title_fontsize=14, label_fontsize=12, xticklabel_fontsize=12, yticklabel_fontsize=12, 
         grid=True, facecolor='whitesmoke', legend_facecolor='whitesmoke', 
-        subplot_adjust=(None, None, 0.18, None), savepath=None, show=False,
+        subplot_adjust=(None, None, 0.18, None), savepath=None, show=False, draw=True,
         with_gcm_distribution_on_the_side=True, path_delta_change=None, sheet_delta_change=None,
         bin_width=None, color_gcm=None, color_map_gcm=None):
 
@@ -91,6 +95,11 @@ def TwoVarLineplot(
         - show: bool (Optional, default is False)
             If True, the plot is displayed
 
+        - draw: bool (Optional, default is True)
+            If False, the inputs are validated but no figure is built and the returned figure
+            and axes are None. Useful when the function is called only as a sanity check on
+            the data.
+
         - with_gcm_distribution_on_the_side: bool (Optional, default is True)
             If True, the GCM distribution is plotted on the side of the plot. This function requires
             delta change factors to be pre-processed (typically using the 'ClimProjTools' package:
@@ -120,40 +129,46 @@ def TwoVarLineplot(
             
     """
 
-    try:
-        len(x_axis) == array.shape[0]
-    except:
+    x_axis = np.asarray(x_axis)
+    if len(x_axis) != array.shape[0]:
         raise ValueError('The x_axis must have the same length as the array')
-    
-    try:
-        len(colors) == len(z_dim)
-    except: 
+
+    if not isinstance(colors, str) and len(colors) < max(z_dim) + 1:
         raise ValueError('The number of colors must be equal to the number of z_dim')
-    
-    try:
-        max(z_dim) < array.shape[1]
-    except:
+
+    if max(z_dim) >= array.shape[1]:
         raise ValueError('The maximum value of z_dim must be less than the number of dimensions of the array')
 
+    if not draw:
+        # Inputs validated above; skip all figure construction
+        return (None,) * (3 if with_gcm_distribution_on_the_side else 2)
+
     if figsize is None:
         if with_gcm_distribution_on_the_side == False:
             figsize = (8, 5)
         else:
             figsize = (8, 6)
 
+    # Batch all the z lines into a single LineCollection artist rather than
+    # one Line2D per z; matplotlib then configures and draws one artist no
+    # matter how many lines are requested
+    segments = [np.column_stack([x_axis, array[:, z]]) for z in z_dim]
+    if isinstance(colors, str):
+        line_colors = [colors] * len(z_dim)
+    else:
+        line_colors = [colors[z] for z in z_dim]
+
     if with_gcm_distribution_on_the_side == False:
-        
+
         fig, ax = plt.subplots(figsize=figsize)
 
-        for z in z_dim:
-            if caption_labels:
-                label = caption_labels[z]
-            else:
-                label = None
-            ax.plot(x_axis, array[:,z], color=colors[z], label=label, lw=linewidth)
+        lines = LineCollection(segments, colors=line_colors, linewidths=linewidth)
+        ax.add_collection(lines)
+        ax.autoscale_view()
 
         if threshold:
-            ax.axhline(threshold, color=color_threshold, linestyle='--', label=label_threshold)
+            threshold_line = ax.axhline(threshold, color=color_threshold, linestyle='--',
+                                        label=label_threshold)
 
         ax.set_title(title, fontsize=title_fontsize)
         ax.set_ylabel(ylabel, fontsize=label_fontsize)
@@ -166,8 +181,13 @@ def TwoVarLineplot(
             ax.set_facecolor(facecolor)
 
         if caption_labels:
-            handles, labels = ax.get_legend_handles_labels()
-            legend = plt.figlegend(handles, labels, columnspacing=0.5, handletextpad=0.5, 
+            # Proxy handles for the LineCollection, which has no per-line legend entries
+            handles = [Line2D([], [], color=c, lw=linewidth) for c in line_colors]
+            labels = [caption_labels[z] for z in z_dim]
+            if threshold:
+                handles.append(threshold_line)
+                labels.append(label_threshold)
+            legend = plt.figlegend(handles, labels, columnspacing=0.5, handletextpad=0.5,
                                 loc='lower center', ncol=len(z_dim), bbox_to_anchor=(0.5,-0.01),
                                 fontsize=label_fontsize)
             if legend_facecolor:
@@ -192,15 +212,13 @@ def TwoVarLineplot(
         ax1 = fig.add_subplot(gs[0]) # Main scatter plot
         ax2 = fig.add_subplot(gs[1], sharex=ax1) # GCM distribution on the bottom
 
-        for z in z_dim:
-            if caption_labels:
-                label = caption_labels[z]
-            else:
-                label = None
-            ax1.plot(x_axis, array[:,z], color=colors[z], label=label, lw=linewidth)
+        lines = LineCollection(segments, colors=line_colors, linewidths=linewidth)
+        ax1.add_collection(lines)
+        ax1.autoscale_view()
 
         if threshold:
-            ax1.axhline(threshold, color=color_threshold, linestyle='--', label=label_threshold)
+            threshold_line = ax1.axhline(threshold, color=color_threshold, linestyle='--',
+                                         label=label_threshold)
 
         ax1.set_title(title, fontsize=title_fontsize)
         ax1.set_ylabel(ylabel, fontsize=label_fontsize)
@@ -210,8 +228,13 @@ def TwoVarLineplot(
             ax1.set_facecolor(facecolor)
 
         if caption_labels:
-            handles, labels = ax1.get_legend_handles_labels()
-            legend = plt.figlegend(handles, labels, columnspacing=0.5, handletextpad=0.5, 
+            # Proxy handles for the LineCollection, which has no per-line legend entries
+            handles = [Line2D([], [], color=c, lw=linewidth) for c in line_colors]
+            labels = [caption_labels[z] for z in z_dim]
+            if threshold:
+                handles.append(threshold_line)
+                labels.append(label_threshold)
+            legend = plt.figlegend(handles, labels, columnspacing=0.5, handletextpad=0.5,
                                 loc='lower center', ncol=len(z_dim), bbox_to_anchor=(0.5,-0.01),
                                 fontsize=label_fontsize)
             if legend_facecolor:
@@ -222,9 +245,11 @@ def TwoVarLineplot(
         
     
         if bin_width is not None:
-            bins = np.arange(x_axis.min(), x_axis.max(), bin_width)
+            bins = _bin_edges(float(x_axis.min()), float(x_axis.max()), float(bin_width))
         else:
-            bins = 20
+            # Resolve the edges once so every period shares identical bins
+            # instead of hist() rescanning the data per call
+            bins = np.histogram_bin_edges(delta_change.values, bins=20)
 
         if len(delta_change.columns) == 1:
             alpha = [1]
@@ -238,12 +263,9 @@ def TwoVarLineplot(
             else:
                 color_gcm_hist = color_gcm
         else:
-            # Generate a list of colors from the 'YlOrBr' colormap. The list has the same length as the number of periods
-            if color_map_gcm is not None:
-                color_gcm_hist = \
-                    plt.cm.get_cmap(color_map_gcm)(np.linspace(0, 1, len(delta_change.columns)))
-            else:
-                color_gcm_hist = plt.cm.YlOrBr(np.linspace(0, 1, len(delta_change.columns)))
+            # Generate a list of colors from the colormap. The list has the same length as the number of periods
+            color_gcm_hist = _gcm_colors(color_map_gcm if color_map_gcm is not None else 'YlOrBr',
+                                         len(delta_change.columns))
 
         for i, col in enumerate(delta_change.columns):
             ax2.hist(delta_change[col], bins=bins, alpha=alpha[i], color=color_gcm_hist[i], label=col)
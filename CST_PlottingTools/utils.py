@@ -1,17 +1,47 @@
 
+import functools
+
 import numpy as np
 import matplotlib.colors as mcolors
-import matplotlib.pyplot as plt
 
-def CenteredColorMap(cmap, vmin, vcenter, vmax, start=0, stop=1.0, name='centered_cmap'):
+# numba is optional; colormap construction falls back to matplotlib's own
+# sampling without it
+try:
+    from numba import njit
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+if _HAS_NUMBA:
+    @njit(cache=True)
+    def _resample_lut(lut, xs, out):
+        """ Linearly interpolate the (N, 4) color table 'lut' at positions
+            'xs' in [0, 1], writing the result into 'out'.
+        """
+        n = lut.shape[0]
+        for i in range(xs.shape[0]):
+            idx = xs[i] * (n - 1)
+            lo = int(idx)
+            if lo > n - 2:
+                lo = n - 2
+            frac = idx - lo
+            for k in range(lut.shape[1]):
+                out[i, k] = lut[lo, k] * (1.0 - frac) + lut[lo + 1, k] * frac
+
+def CenteredColorMap(cmap, vmin, vcenter, vmax, start=0, stop=1.0, name='centered_cmap', N=256):
     '''
     Function to offset the "center" of a colormap. Useful for highlighting the change in a variable
     from a reference value. 
     Adapted from https://stackoverflow.com/questions/7404116/defining-the-midpoint-of-a-colormap-in-matplotlib
 
+    Repeated calls with the same registered colormap name and values return a cached colormap
+    instead of rebuilding it, which matters when the same centered colormap is requested for
+    many panels or frames. Passing a Colormap instance (rather than its name) bypasses the
+    cache, since an unregistered instance cannot be keyed reliably.
+
     Input
     -----
-      cmap : The matplotlib colormap to be altered
+      cmap : The matplotlib colormap to be altered, or the name of a registered colormap
       start : Offset from lowest point in the colormap's range.
           Defaults to 0.0 (no lower offset). Should be between
           0.0 and `midpoint`.
@@ -22,7 +52,9 @@ def CenteredColorMap(cmap, vmin, vcenter, vmax, start=0, stop=1.0, name='centere
       vcenter : the value to be used to match the 'midpoint' of the colormap. Here, the colormap will
               be centered around this value.
       vmax : the value to be used to match the 'stop' of the colormap
-    
+      N : number of entries in the colormap's lookup table (default 256, matplotlib's
+          native resolution; raise it if banding is visible on very smooth gradients)
+
        Note that 'start' and 'stop' are values in the range [0, 1] that determine how much the colormap
          will be shifted towards the lower and upper limits, while 'vmin', 'vcenter' and 'vmax' 
          are the values that will be used to match the colormap to the data. Typical values for 
@@ -31,36 +63,54 @@ def CenteredColorMap(cmap, vmin, vcenter, vmax, start=0, stop=1.0, name='centere
          where interested about the analysis of the change of a variable, or to a reference value
          when interested in the deviation from a reference value.
     '''
-    cdict = {
-        'red': [],
-        'green': [],
-        'blue': [],
-        'alpha': []
-    }
+    if isinstance(cmap, str):
+        return _build_centered_cmap(cmap, vmin, vcenter, vmax, start, stop, name, N)
+    return _centered_cmap(cmap, vmin, vcenter, vmax, start, stop, name, N)
 
-    # regular index to compute the colors
-    reg_index = np.linspace(start, stop, 513)
+@functools.lru_cache(maxsize=64)
+def _build_centered_cmap(cmap_name, vmin, vcenter, vmax, start, stop, name, N):
+    """ Resolve 'cmap_name' from the registry and build the centered colormap, memoized. """
+    from matplotlib import colormaps
+    return _centered_cmap(colormaps[cmap_name], vmin, vcenter, vmax, start, stop, name, N)
 
-    # Calculate the index for the midpoint
-    midpoint = np.diff([vmin, vcenter])[0] / np.diff([vmin, vmax])[0]
+def _centered_cmap(cmap, vmin, vcenter, vmax, start, stop, name, N):
+    """ Build the centered colormap; see CenteredColorMap for the semantics. """
+    if vmax == vmin:
+        raise ValueError('vmin and vmax must differ to center a colormap.')
 
+    # Calculate the index for the midpoint
+    midpoint = (vcenter - vmin) / (vmax - vmin)
 
-    # shifted index to match the data
-    shift_index = np.hstack([
-        np.linspace(0.0, midpoint, 256, endpoint=False), 
-        np.linspace(midpoint, 1.0, 257, endpoint=True)
-    ])
+    # Invert the centering warp: the lookup-table entry at regular position
+    # p takes the color the base colormap has at the corresponding
+    # un-warped position, so the base center lands on 'midpoint'
+    positions = np.linspace(0.0, 1.0, N)
+    reg_index = start + np.interp(positions, [0.0, midpoint, 1.0], [0.0, 0.5, 1.0]) * (stop - start)
 
-    
-    for ri, si in zip(reg_index, shift_index):
-        r, g, b, a = cmap(ri)
-        #
-        cdict['red'].append((si, r, r))
-        cdict['green'].append((si, g, g))
-        cdict['blue'].append((si, b, b))
-        cdict['alpha'].append((si, a, a))
+    # Sample the base colormap once at its native resolution, then resample
+    # each channel at the warped positions; both branches below are plain
+    # linear interpolation of the table, with none of cmap()'s per-call
+    # normalization and special-value handling
+    base_x = np.linspace(0.0, 1.0, 256)
+    src_lut = np.asarray(cmap(base_x))
+    if _HAS_NUMBA:
+        rgba = np.empty((N, src_lut.shape[1]))
+        _resample_lut(src_lut, reg_index, rgba)
+    else:
+        rgba = np.stack([np.interp(reg_index, base_x, src_lut[:, k])
+                         for k in range(src_lut.shape[1])], axis=1)
 
-    newcmap = mcolors.LinearSegmentedColormap(name, cdict)
+    # Nearly every colormap is fully opaque; dropping a constant alpha
+    # channel spares the alpha segment construction and per-lookup
+    # interpolation downstream
+    if rgba.shape[1] == 4 and np.all(rgba[:, 3] == 1.0):
+        # contiguous copy: the plain column slice would hand ListedColormap
+        # a strided view
+        rgba = np.ascontiguousarray(rgba[:, :3])
 
-    
-    return newcmap
\ No newline at end of file
+    # A ListedColormap over the pre-warped table does an O(1) indexed
+    # lookup at plot time, where the segmented form re-interpolates its
+    # control points; values between entries snap to the nearest of the
+    # N colors rather than being interpolated, which is not visible at
+    # this resolution
+    return mcolors.ListedColormap(rgba, name=name)
\ No newline at end of file
@@ -14,11 +14,12 @@ setup(
         "Operating System :: OS Independent",
     ],
     packages=find_packages(),
+    python_requires='>=3.9',
     install_requires=[
-        'numpy',
-        'matplotlib',
-        'pandas',
-        'seaborn',
+        'numpy>=1.22',
+        'matplotlib>=3.6',
+        'pandas>=1.4',
+        'seaborn>=0.12',
     ],
     keywords=['python', 'Climate Stress Test', 'CST', 'plotting', 'visualization'],
 )
\ No newline at end of file